@@ -7,6 +7,13 @@ import struct
 
 LOG = logging.getLogger(__name__)
 
+# Prebuilt byte -> printable character table for the hex dump; control
+# characters and non-printable bytes show as '.'
+_PRINT_TABLE = bytes(
+    b if chr(b) in string.printable and b not in (0x9, 0xA, 0xB, 0xC, 0xD)
+    else ord(".")
+    for b in range(256))
+
 class BinaryBlob:
     """Manage the binary blob."""
 
@@ -93,34 +100,14 @@ class BinaryBlob:
 
     def dump(self):
         """Dump Hex value."""
-        index = 0
-        linestr = ""
-        printstr = ""
-
-        while index < self.length:
-            if (index % 16) == 0:
-                if len(linestr) != 0:
-                    LOG.info("%s %s", linestr, printstr)
-                    printstr = ''
-                # line prefix string
-                # pylint: disable=consider-using-f-string
-                linestr = "{0:08X}  ".format(int(index / 16) * 16 + \
-                    self._base_address)
-
-            # pylint: disable=consider-using-f-string
-            linestr += "{0:02X} ".format(self._data[index])
-            if chr(self._data[index]) in set(string.printable) and \
-               self._data[index] not in [0xC, 0xB, 0xA, 0xD, 0x9]:
-                printstr += chr(self._data[index])
-            else:
-                printstr += '.'
-
-            index += 1
-
-        if (index % 16) != 0:
-            blank = ""
-            for _ in range(16 - index % 16):
-                blank = blank + "   "
-            LOG.info("%s%s %s", linestr, blank, printstr)
-        elif index == self.length:
-            LOG.info("%s %s", linestr, printstr)
+        data = self._data
+        base = self._base_address
+
+        for index in range(0, len(data), 16):
+            # Format a whole 16 byte row at once: the hex column through
+            # bytes.hex and the printable column through the prebuilt
+            # translation table, instead of per-byte string formatting
+            row = data[index:index + 16]
+            hexstr = row.hex(" ").upper() + " " + "   " * (16 - len(row))
+            printstr = row.translate(_PRINT_TABLE).decode("ascii")
+            LOG.info("%08X  %s %s", base + index, hexstr, printstr)
@@ -3,6 +3,8 @@ TCG compliant Event log
 """
 
 import logging
+import mmap
+import struct
 from hashlib import sha1, sha256, sha384, sha512
 from evidence_api.binaryblob import BinaryBlob
 from evidence_api.tcg import TcgAlgorithmRegistry
@@ -20,6 +22,77 @@ from evidence_api.tcgcel import TcgTpmsEventImaTemplate
 
 LOG = logging.getLogger(__name__)
 
+# Precompiled structs for the fixed-shape blocks of the TCG PCClient event log.
+# unpack_from decodes a whole group of fields in one call instead of going
+# through BinaryBlob field by field.
+_SPEC_ID_HDR = struct.Struct("<II20xI") # pcrIndex, eventType, digest (skipped), eventDataSize
+_SPEC_ID_FIXED = struct.Struct("<16sIBBBBI") # signature through numberOfAlgorithms
+_ALG_SIZE = struct.Struct("<HH")        # algorithmId, digestSize
+# The spec id header digest is defined by the TCG spec to be 20 zero bytes
+_ZERO_DIGEST = bytes(20)
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+# Flyweight cache of TcgDigest instances. Event logs repeat the same
+# digest many times (zeroed separator digests, identical measurements),
+# so share one TcgDigest per distinct (alg_id, digest) pair. Bounded to
+# keep pathological logs from growing the cache without limit.
+_DIGEST_CACHE = {}
+_DIGEST_CACHE_MAX = 4096
+
+def _intern_digest(alg_id:int, digest_hash:bytes) -> TcgDigest:
+    """Return a shared TcgDigest instance for the given pair.
+
+    Args:
+        alg_id: algorithm ID of the digest
+        digest_hash: raw digest value in bytes
+
+    Returns:
+        A TcgDigest shared between all events carrying the same digest
+    """
+    key = (alg_id, digest_hash)
+    digest = _DIGEST_CACHE.get(key)
+    if digest is None:
+        if len(_DIGEST_CACHE) >= _DIGEST_CACHE_MAX:
+            _DIGEST_CACHE.clear()
+        digest = TcgDigest(alg_id, digest_hash)
+        _DIGEST_CACHE[key] = digest
+    return digest
+
+class _DigestList:
+    """Digest sequence of one event stored as parallel arrays.
+
+    Instead of a list of TcgDigest objects, keep the (algo_id, offset, size)
+    entries and the raw digest block in two compact fields, and materialize
+    the TcgDigest objects only when the digests are actually accessed
+    (dump, replay, verification). Events that are never inspected pay for
+    no digest objects at all.
+    """
+
+    __slots__ = ("_entries", "_block", "_digests")
+
+    def __init__(self, entries:list, block:bytes) -> None:
+        self._entries = entries
+        self._block = block
+        self._digests = None
+
+    def _materialize(self) -> list[TcgDigest]:
+        if self._digests is None:
+            block = self._block
+            self._digests = [_intern_digest(alg_id, block[offset:offset + size])
+                             for alg_id, offset, size in self._entries]
+        return self._digests
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __getitem__(self, index) -> TcgDigest:
+        return self._materialize()[index]
+
 class TcgEventLog:
     """TcgEventLog class.
 
@@ -45,6 +118,9 @@ class TcgEventLog:
     TCG_FORMAT_CEL_JSON = 3
     TCG_FORMAT_CEL_CBOR = 4
 
+    __slots__ = ("_rec_num", "_imr_index", "_event_type", "_digests",
+                 "_event_size", "_event", "_extra_info")
+
     def __init__(self, rec_num:int, imr_index:int, event_type:TcgEventType, digests:list[TcgDigest],
                  event_size:int, event:bytes, extra_info=None) -> None:
         self._rec_num = rec_num
@@ -118,6 +194,13 @@ class EventLogs:
         parse_format: event log format used for parsing
     """
     spec_id_header_event = None
+    # Map algo_id -> digest size built from the spec id header event for
+    # O(1) lookup while parsing digests
+    digest_size_map = {}
+    # Specialized (algorithmId, digest) decoder installed when the spec id
+    # header declares a single algorithm, which is the common case on TDX
+    _single_alg_id = None
+    _single_digest_struct = None
 
     def __init__(
         self,
@@ -130,20 +213,58 @@ class EventLogs:
         self._runtime_data = runtime_data
         self._event_logs = []
         self._count:int = 0
+        self._parsed:bool = False
         self._parse_format:str = parse_format
         # Initiate the record number list for each index with default value 0
         self.event_logs_record_number_list = [0] * 24
         # Underlying platform that the event logs come from
         self.platform = platform
 
+    @classmethod
+    def from_path(
+        cls,
+        boot_time_log_path:str,
+        runtime_log_path:str=None,
+        platform:int=0,
+        parse_format:str=None
+    ) -> "EventLogs":
+        """Construct EventLogs backed by a memory-mapped boot time log file.
+
+        The boot time log is mapped read-only with mmap, so parsing reads
+        straight from the page cache instead of copying the whole file into
+        a bytes object first. The runtime (IMA) log is line oriented and is
+        still read as bytes.
+
+        Args:
+            boot_time_log_path: path of the raw boot time event log file
+            runtime_log_path: path of the runtime (IMA) event log file
+            platform: underlying platform that the event logs come from
+            parse_format: event log format used for parsing
+
+        Returns:
+            An EventLogs instance
+        """
+        with open(boot_time_log_path, "rb") as log_file:
+            boot_time_data = mmap.mmap(log_file.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+
+        runtime_data = None
+        if runtime_log_path is not None:
+            with open(runtime_log_path, "rb") as log_file:
+                runtime_data = log_file.read()
+
+        return cls(boot_time_data, runtime_data, platform, parse_format)
+
     @property
     def event_logs(self):
-        """Parsed event logs."""
+        """Parsed event logs, parsed on first access."""
+        self._parse()
         return self._event_logs
 
     @property
     def count(self):
-        """Total number of event logs."""
+        """Total number of event logs, parsed on first access."""
+        self._parse()
         return self._count
 
     def dump(self, is_raw=True) -> None:
@@ -154,7 +275,7 @@ class EventLogs:
                 True: dump in hex strings
                 False: dump in human readable texts
         """
-        if self._count == 0:
+        if self.count == 0:
             LOG.info("No event log found.")
             return
 
@@ -185,6 +306,7 @@ class EventLogs:
         """
         self._parse()
 
+        begin = 0
         if start is not None:
             if start == self._count:
                 LOG.info("Input start equal to count. No more event log returned.")
@@ -196,15 +318,19 @@ class EventLogs:
                 LOG.error("Invalid input start. Start must be number larger than 0 and smaller than total event log count.")
                 raise ValueError("Invalid parameter start.")
 
-            self._event_logs = self._event_logs[start:]
+            begin = start
 
         if count is not None:
-            if not 0 < count <= len(self._event_logs):
+            if not 0 < count <= self._count - begin:
                 # pylint: disable-next=line-too-long
                 LOG.error("Invalid input count. count must be number larger than 0 and smaller than total event log count.")
                 raise ValueError("Invalid parameter count.")
 
-            self._event_logs = self._event_logs[:count]
+            # Cut the selected window out in one slice instead of slicing
+            # the tail and the head separately
+            self._event_logs = self._event_logs[begin:begin + count]
+        elif begin > 0:
+            self._event_logs = self._event_logs[begin:]
 
     def _get_record_number(self, imr_index:int) -> int:
         """Fetch the record number maintained separately by index.
@@ -221,49 +347,186 @@ class EventLogs:
 
         return rec_num
 
+    def iter_events(self):
+        """Iterate over event logs without materializing the whole list.
+
+        Yields the parsed event logs one by one in the requested parse
+        format. When the logs were already parsed the cached entries are
+        yielded; otherwise events are decoded straight from the raw data,
+        so a caller that verifies events one at a time never holds more
+        than one freshly decoded event alive.
+        """
+        if self._parsed:
+            yield from self._event_logs
+            return
+
+        if self._boot_time_data is None:
+            LOG.error("No boot time event log found.")
+            return
+
+        # Streaming walk keeps its own record number bookkeeping so that a
+        # later full parse starts from a clean state
+        self.event_logs_record_number_list = [0] * 24
+        yield from self._iter_boot_time_events(memoryview(self._boot_time_data))
+
+        if self._runtime_data is None:
+            return
+
+        for event in self._runtime_data.splitlines():
+            yield self._parse_ima_event_log(event).format_event_log(
+                TcgEventLog.TCG_FORMAT_CEL)
+
+    def _iter_boot_time_events(self, data:memoryview):
+        """Decode boot time events from the raw data one at a time.
+
+        Args:
+            data: a memoryview of the event log data
+
+        Yields:
+            The boot time event logs in the requested parse format
+        """
+        index = 0
+
+        # Bind hot names to locals so the loop below does not pay the
+        # attribute/global lookup cost on every event
+        length = len(data)
+        unpack_hdr = _U64.unpack_from
+        hdr_size = _U64.size
+        ev_no_action = TcgEventType.EV_NO_ACTION
+        parse_format = self._parse_format
+        parse_event_log = self._parse_event_log
+        count = 0
+
+        while index < length:
+            # Prefetch pcrIndex and eventType as one u64; the low half is
+            # the 0xFFFFFFFF padding sentinel when the log ends early
+            hdr, = unpack_hdr(data, index)
+            index += hdr_size
+
+            if hdr & 0xFFFFFFFF == 0xFFFFFFFF:
+                break
+            imr_index = hdr & 0xFFFFFFFF
+            event_type = hdr >> 32
+
+            # The header fields are handed down so the helpers continue
+            # right past them instead of re-reading the same bytes
+            if event_type == ev_no_action and count == 0:
+                spec_id_event, index = \
+                    self._parse_spec_id_event_log(data, index, imr_index,
+                                                  event_type)
+                yield spec_id_event.format_event_log(parse_format)
+                count += 1
+            else:
+                event_log, index = parse_event_log(data, index, imr_index,
+                                                   event_type)
+                yield event_log.format_event_log(parse_format)
+                count += 1
+
     def _parse(self) -> None:
         """Parse event log data into TCG compatible forms.
 
         Run through all event log data and parse the contents accordingly
-        Save the parsed event logs into TcgEventLog.
+        Save the parsed event logs into TcgEventLog. The work is done only
+        once; later calls return the cached result.
         """
+        if self._parsed:
+            return
+
         if self._boot_time_data is None:
             LOG.error("No boot time event log found.")
             return
 
-        blob = BinaryBlob(self._boot_time_data, 0)
-        index = 0
+        # A zero-copy view over the raw data so that per-event suffixes
+        # passed down to the parse helpers do not copy the whole tail
+        data = memoryview(self._boot_time_data)
 
-        while index < len(self._boot_time_data):
-            start = index
-            imr, index = blob.get_uint32(index)
-            event_type, index = blob.get_uint32(index)
-
-            if imr == 0xFFFFFFFF:
-                break
+        # Size the result list once from a cheap boundary scan instead of
+        # growing it entry by entry, then fill it from the streaming walk
+        self.event_logs_record_number_list = [0] * 24
+        event_logs = [None] * self._scan_boot_time_event_count(data)
+        count = 0
+        for entry in self._iter_boot_time_events(data):
+            event_logs[count] = entry
+            count += 1
 
-            if event_type == TcgEventType.EV_NO_ACTION and self._count == 0:
-                spec_id_event, event_len = \
-                    self._parse_spec_id_event_log(self._boot_time_data[start:])
-                index = start + event_len
-                self._event_logs.append(spec_id_event.format_event_log(self._parse_format))
-                self._count += 1
-            else:
-                event_log, event_len = self._parse_event_log(self._boot_time_data[start:])
-                index = start + event_len
-                self._event_logs.append(event_log.format_event_log(self._parse_format))
-                self._count += 1
+        self._event_logs = event_logs
+        self._count = count
+        self._parsed = True
 
         if self._runtime_data is None:
             return
 
-        for event in self._runtime_data.splitlines():
-            event_log = self._parse_ima_event_log(event)
-            self._event_logs.append(
-                event_log.format_event_log(TcgEventLog.TCG_FORMAT_CEL))
-            self._count += 1
+        ima_events = self._runtime_data.splitlines()
+        self._event_logs.extend(
+            self._parse_ima_event_log(event).format_event_log(TcgEventLog.TCG_FORMAT_CEL)
+            for event in ima_events)
+        self._count += len(ima_events)
 
-    def _parse_spec_id_event_log(self, data:bytes) -> (TcgEventLog, int):
+    @staticmethod
+    def _scan_boot_time_event_count(data:memoryview) -> int:
+        """Count boot time events with a boundary-only scan.
+
+        Walk the same event layout as the full parse but read just enough
+        header fields to skip from one event to the next, without creating
+        any event or digest objects. Used to pre-size the event log list.
+
+        Args:
+            data: a memoryview of the event log data
+
+        Returns:
+            The number of boot time events in the data
+        """
+        count = 0
+        index = 0
+        length = len(data)
+        digest_sizes = {}
+        unpack_hdr = _U64.unpack_from
+        hdr_size = _U64.size
+        unpack_u32 = _U32.unpack_from
+        unpack_u16 = _U16.unpack_from
+        ev_no_action = TcgEventType.EV_NO_ACTION
+        get_digest_size = digest_sizes.get
+
+        while index + hdr_size <= length:
+            hdr, = unpack_hdr(data, index)
+
+            if hdr & 0xFFFFFFFF == 0xFFFFFFFF:
+                break
+            event_type = hdr >> 32
+
+            if event_type == ev_no_action and count == 0:
+                # TCG_PCClientPCREvent header: event size follows the
+                # 20 byte digest; the algorithm sizes sit at a fixed
+                # offset inside the TCG_EfiSpecIDEventStruct body
+                event_size, = unpack_u32(data, index + 28)
+                num_of_algo, = unpack_u32(
+                    data, index + _SPEC_ID_HDR.size + _SPEC_ID_FIXED.size - 4)
+                offset = index + _SPEC_ID_HDR.size + _SPEC_ID_FIXED.size
+                for _ in range(num_of_algo):
+                    algo_id, digest_size = _ALG_SIZE.unpack_from(data, offset)
+                    digest_sizes[algo_id] = digest_size
+                    offset += _ALG_SIZE.size
+                index += _SPEC_ID_HDR.size + event_size
+            else:
+                offset = index + hdr_size
+                digest_count, = unpack_u32(data, offset)
+                offset += 4
+                for _ in range(digest_count):
+                    alg_id, = unpack_u16(data, offset)
+                    digest_size = get_digest_size(alg_id)
+                    if digest_size is None:
+                        # Unknown algorithm: let the real parse report it
+                        return count
+                    offset += 2 + digest_size
+                event_size, = unpack_u32(data, offset)
+                index = offset + 4 + event_size
+
+            count += 1
+
+        return count
+
+    def _parse_spec_id_event_log(self, data:memoryview, offset:int, imr_index:int,
+                                 header_event_type:int) -> (TcgEventLog, int):
         """Parse TCG specification Id event according to TCG spec at
         https://trustedcomputinggroup.org/wp-content/uploads/TCG_PCClientSpecPlat_TPM_2p0_1p04_pub.pdf.
 
@@ -277,49 +540,47 @@ class EventLogs:
         } TCG_PCClientPCREvent;
 
         Args:
-            data: event log data in bytes
+            data: a memoryview of the whole event log data
+            offset: offset right past the pcrIndex/eventType header fields
+            imr_index: pcrIndex prefetched by the caller
+            header_event_type: eventType prefetched by the caller
 
         Returns:
             A common TcgEventLog containing the Specification ID version event
-            An int specifying the event size
+            An int specifying the offset of the next event
         """
-        index = 0
-
-        blob = BinaryBlob(data, 0)
-
-        imr_index, index = blob.get_uint32(index)
-        header_event_type, index = blob.get_uint32(index)
+        # Skip the 20 zero digest bytes, then read the event data size
+        header_event_size, = _U32.unpack_from(data, offset + 20)
+        index = offset + 24
 
         rec_num = self._get_record_number(imr_index)
 
-        digest, index = blob.get_bytes(index, 20)  # 20 zero for digest
-        # Convert digest to common TcgDigest type
-        digest = TcgDigest(TcgAlgorithmRegistry.TPM_ALG_ERROR, digest)
+        # The header digest is 20 zero bytes per spec; skip the copy and
+        # use the shared constant
+        digest = TcgDigest(TcgAlgorithmRegistry.TPM_ALG_ERROR, _ZERO_DIGEST)
         digests = []
         digests.append(digest)
 
-        header_event_size, index = blob.get_uint32(index) # 4 bytes containing event size
-        header_event, _ = blob.get_bytes(index, header_event_size)
+        header_event = bytes(data[index:index + header_event_size])
 
         specification_id_header = TcgEventLog(rec_num, imr_index, header_event_type, digests,
                                                    header_event_size, header_event)
 
         # Parse EFI Spec Id Event structure
-        spec_id_signature, index = blob.get_bytes(index, 16)
-        spec_id_platform_cls, index = blob.get_uint32(index)
-        spec_id_version_minor, index = blob.get_uint8(index)
-        spec_id_version_major, index = blob.get_uint8(index)
-        spec_id_errata, index = blob.get_uint8(index)
-        spec_id_uint_size, index = blob.get_uint8(index)
-        spec_id_num_of_algo, index = blob.get_uint32(index)
+        (spec_id_signature, spec_id_platform_cls, spec_id_version_minor,
+         spec_id_version_major, spec_id_errata, spec_id_uint_size,
+         spec_id_num_of_algo) = _SPEC_ID_FIXED.unpack_from(data, index)
+        index += _SPEC_ID_FIXED.size
         spec_id_digest_sizes = []
         for _ in range(spec_id_num_of_algo):
-            algo_id, index = blob.get_uint16(index)
-            digest_size, index = blob.get_uint16(index)
+            algo_id, digest_size = _ALG_SIZE.unpack_from(data, index)
+            index += _ALG_SIZE.size
             spec_id_digest_sizes.append(TcgEfiSpecIdEventAlgorithmSize(algo_id, digest_size))
-        spec_id_vendor_size, index = blob.get_uint8(index)
+        spec_id_vendor_size = data[index]
+        index += 1
         if spec_id_vendor_size > 0:
-            spec_id_vendor_info, index = blob.get_bytes(index, int(spec_id_vendor_size))
+            spec_id_vendor_info = bytes(data[index:index + spec_id_vendor_size])
+            index += spec_id_vendor_size
         else:
             spec_id_vendor_info = bytes()
         EventLogs.spec_id_header_event = \
@@ -328,10 +589,20 @@ class EventLogs:
                               spec_id_errata, spec_id_uint_size, spec_id_num_of_algo,
                               spec_id_digest_sizes, spec_id_vendor_size,
                               spec_id_vendor_info)
+        EventLogs.digest_size_map = \
+            {alg.algo_id: alg.digest_size for alg in spec_id_digest_sizes}
+        if len(spec_id_digest_sizes) == 1:
+            EventLogs._single_alg_id = spec_id_digest_sizes[0].algo_id
+            EventLogs._single_digest_struct = \
+                struct.Struct(f"<H{spec_id_digest_sizes[0].digest_size}s")
+        else:
+            EventLogs._single_alg_id = None
+            EventLogs._single_digest_struct = None
 
         return specification_id_header, index
 
-    def _parse_event_log(self, data:bytes) -> (TcgEventLog, int):
+    def _parse_event_log(self, data:memoryview, offset:int, imr_index:int,
+                         event_type:int) -> (TcgEventLog, int):
         """Parse TCG event log body as single event log entry (TcgImrEventLogEntry) defined at
         https://trustedcomputinggroup.org/wp-content/uploads/TCG_PCClientSpecPlat_TPM_2p0_1p04_pub.pdf
 
@@ -344,37 +615,59 @@ class EventLogs:
         } TCG_PCR_EVENT2;
 
         Args:
-            data: event log data in bytes
+            data: a memoryview of the whole event log data
+            offset: offset right past the pcrIndex/eventType header fields
+            imr_index: pcrIndex prefetched by the caller
+            event_type: eventType prefetched by the caller
 
         Returns:
             A TcgEventLog containing the event information
-            An int specifying the event size
+            An int specifying the offset of the next event
         """
-        index = 0
-
-        blob = BinaryBlob(data, 0)
-
-        imr_index, index = blob.get_uint32(index)
-        event_type, index = blob.get_uint32(index)
+        index = offset
 
         rec_num = self._get_record_number(imr_index)
 
-        # Fetch digest count and get each digest and its algorithm
-        digest_count, index = blob.get_uint32(index)
-        digests = []
+        # Fetch digest count and get each digest and its algorithm.
+        # Walk the digest entries once to find the block bounds, then
+        # materialize the whole block with a single bytes() call and hand
+        # plain slices of it to TcgDigest instead of copying per digest.
+        digest_count, = _U32.unpack_from(data, index)
+        index += 4
+        if digest_count == 1 and EventLogs._single_digest_struct is not None:
+            # Fast path: the spec id header declared a single algorithm, so
+            # (algorithmId, digest) can be decoded in one precompiled unpack
+            alg_id, digest_data = \
+                EventLogs._single_digest_struct.unpack_from(data, index)
+            if alg_id != EventLogs._single_alg_id:
+                raise ValueError(f'No algorithm with such algo_id {alg_id} found')
+            digests = [_intern_digest(alg_id, digest_data)]
+            index += EventLogs._single_digest_struct.size
+            event_size, = _U32.unpack_from(data, index)
+            index += 4
+            event = bytes(data[index:index + event_size])
+            index += event_size
+            entry = TcgEventLog(rec_num, imr_index, event_type, digests,
+                                event_size, event)
+            return entry, index
+        block_start = index
+        entries = []
+        entries_append = entries.append
+        unpack_u16 = _U16.unpack_from
+        get_digest_size = EventLogs.digest_size_map.get
         for _ in range(digest_count):
-            alg_id, index = blob.get_uint16(index)
-            alg = next((alg for alg in \
-                        EventLogs.spec_id_header_event.digest_sizes \
-                        if alg.algo_id == alg_id), None)
-            if alg is None:
+            alg_id, = unpack_u16(data, index)
+            digest_size = get_digest_size(alg_id)
+            if digest_size is None:
                 raise ValueError(f'No algorithm with such algo_id {alg_id} found')
-            digest_size = alg.digest_size
-            digest_data, index = blob.get_bytes(index, digest_size)
-            digest = TcgDigest(alg_id, digest_data)
-            digests.append(digest)
-        event_size, index = blob.get_uint32(index)
-        event, index = blob.get_bytes(index, event_size)
+            entries_append((alg_id, index + 2 - block_start, digest_size))
+            index += 2 + digest_size
+        block = bytes(data[block_start:index])
+        digests = _DigestList(entries, block)
+        event_size, = _U32.unpack_from(data, index)
+        index += 4
+        event = bytes(data[index:index + event_size])
+        index += event_size
 
         # Generate TcgImrEvent using the info parsed
         entry = TcgEventLog(rec_num, imr_index, event_type, digests, event_size,
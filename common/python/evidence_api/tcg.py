@@ -37,6 +37,8 @@ class TcgAlgorithmRegistry:
         TPM_ALG_SHA512: 64
     }
 
+    __slots__ = ("_alg_id",)
+
     @staticmethod
     def get_algorithm_string(alg_id: int) -> str:
         """Return algorithms name from ID.
@@ -70,6 +72,8 @@ class TcgDigest:
     TCG Digest
     """
 
+    __slots__ = ("_hash", "_alg_id")
+
     def __init__(self, alg_id=TcgAlgorithmRegistry.TPM_ALG_SHA384,
                  digest_hash=None):
         self._hash: list = digest_hash
@@ -221,6 +225,9 @@ class TcgImrEvent:
     } TCG_PCR_EVENT2;
     """
 
+    __slots__ = ("_imr_index", "_event_type", "_digests", "_event_size",
+                 "_event")
+
     def __init__(self, imr_index:int, event_type:TcgEventType, digests:list[TcgDigest],
                  event_size:int, event:bytes) -> None:
         self._imr_index = imr_index
@@ -311,6 +318,10 @@ class TcgPcClientImrEvent:
         BYTE event[eventDataSize]; //This is actually a TCG_EfiSpecIDEventStruct
     } TCG_PCClientPCREvent;
     """
+
+    __slots__ = ("_imr_index", "_event_type", "_digest", "_event_data_size",
+                 "_event")
+
     def __init__(self, imr_index:int, event_type:int, digest:bytes, event_data_size:int,
                  event:bytes) -> None:
         self._imr_index = imr_index
@@ -376,6 +387,11 @@ class TcgEfiSpecIdEvent:
     } TCG_EfiSpecIDEventStruct;
     """
 
+    __slots__ = ("_signature", "_platform_class", "_spec_version_minor",
+                 "_sepc_version_major", "_spec_errata", "_uintn_size",
+                 "_number_of_algos", "_digest_sizes", "_vendor_info_size",
+                 "_vendor_info")
+
     def __init__(self, sig:bytes, platform_class:int, spec_version_minor:int,
                  spec_version_major:int, spec_errata:int, uintn_size:int,
                  number_of_algos:int, digest_sizes, vendor_info_size:int,
@@ -452,6 +468,8 @@ class TcgEfiSpecIdEventAlgorithmSize:
     } TCG_EfiSpecIdEventAlgorithmSize;
     """
 
+    __slots__ = ("_algo_id", "_digest_size")
+
     def __init__(self, alg_id:int, digest_size:int) -> None:
         self._algo_id = alg_id
         self._digest_size = digest_size
@@ -512,17 +530,13 @@ class TcgUefiVariableData:
     @classmethod
     def parse(cls, raw_data:bytes):
         """Parse TcgUefiVariableData from raw event data"""
-        blob = BinaryBlob(raw_data, 0)
-        index = 0
-
-        variable_name, index = blob.get_bytes(index, 16)
-        unicode_name_length, index = blob.get_uint64(index)
-        variable_data_length, index = blob.get_uint64(index)
-        unicode_name, index = blob.get_bytes(index, unicode_name_length*2)
-        variable_data = []
-        for _ in range(variable_data_length):
-            data, index = blob.get_uint8(index)
-            variable_data.append(data)
+        variable_name = raw_data[0:16]
+        unicode_name_length = int.from_bytes(raw_data[16:24], "little")
+        variable_data_length = int.from_bytes(raw_data[24:32], "little")
+        index = 32
+        unicode_name = raw_data[index:index + unicode_name_length*2]
+        index += unicode_name_length*2
+        variable_data = list(raw_data[index:index + variable_data_length])
         return TcgUefiVariableData(variable_name, unicode_name_length,
                                    variable_data_length, unicode_name, variable_data)
 
@@ -565,13 +579,12 @@ class TcgUefiPlatformFirmwareBlob2:
     @classmethod
     def parse(cls, raw_data:bytes):
         """Parse TcgUefiPlatformFirmwareBlob from raw event data"""
-        blob = BinaryBlob(raw_data, 0)
-        index = 0
-
-        blob_description_size, index = blob.get_uint8(index)
-        blob_description, index = blob.get_bytes(index, blob_description_size)
-        blob_base, index = blob.get_uint64(index)
-        blob_length, _ = blob.get_uint64(index)
+        blob_description_size = raw_data[0]
+        index = 1
+        blob_description = raw_data[index:index + blob_description_size]
+        index += blob_description_size
+        blob_base = int.from_bytes(raw_data[index:index + 8], "little")
+        blob_length = int.from_bytes(raw_data[index + 8:index + 16], "little")
 
         return TcgUefiPlatformFirmwareBlob2(blob_description_size, blob_description,
                                             blob_base, blob_length)
@@ -597,11 +610,8 @@ class TcgUefiPlatformFirmwareBlob:
     @classmethod
     def parse(cls, raw_data:bytes):
         """Parse TcgUefiPlatformFirmwareBlob from raw event data"""
-        blob = BinaryBlob(raw_data, 0)
-        index = 0
-
-        blob_base, index = blob.get_uint64(index)
-        blob_length, _ = blob.get_uint64(index)
+        blob_base = int.from_bytes(raw_data[0:8], "little")
+        blob_length = int.from_bytes(raw_data[8:16], "little")
 
         return TcgUefiPlatformFirmwareBlob(blob_base, blob_length)
 
@@ -644,17 +654,17 @@ class TcgUefiHandoffTablePointers2:
     @classmethod
     def parse(cls, raw_data:bytes):
         """Parse raw data into UEFI_HANDOFF_TABLE_POINTERS2 structure."""
-        blob = BinaryBlob(raw_data, 0)
-        index = 0
-
-        table_description_size, index = blob.get_uint8(index)
-        table_description, index = blob.get_bytes(index, table_description_size)
-        num_of_table, index = blob.get_uint64(index)
+        table_description_size = raw_data[0]
+        index = 1
+        table_description = raw_data[index:index + table_description_size]
+        index += table_description_size
+        num_of_table = int.from_bytes(raw_data[index:index + 8], "little")
+        index += 8
         table_entries = []
         if num_of_table > 0:
-            size = (len(raw_data) - index)/num_of_table
+            size = (len(raw_data) - index) // num_of_table
         for _ in range(num_of_table):
-            table_data, index = blob.get_bytes(index, size)
-            table_entries.append(table_data)
+            table_entries.append(raw_data[index:index + size])
+            index += size
         return TcgUefiHandoffTablePointers2(table_entries, table_description_size,
                                             table_description, num_of_table)